@@ -1,7 +1,8 @@
 """command-line interface functions for training,
 creating learning curves, etc."""
+import importlib
 
-from . import cli, eval, learncurve, predict, prep, train
+from . import cli
 
 
 __all__ = [
@@ -12,3 +13,15 @@ __all__ = [
     "prep",
     "train",
 ]
+
+
+def __getattr__(name):
+    # sub-modules for each command are imported on first access,
+    # so that running one command does not import all the others
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,16 +1,15 @@
-from .eval import eval
-from .train import train
-from .learncurve import learning_curve
-from .predict import predict
-from .prep import prep
+import importlib
 
 
+# map each command to the module and function that run it.
+# Modules are only imported when a command is run, so that e.g. ``vak prep``
+# does not pay the cost of importing everything needed by ``vak train``
 COMMAND_FUNCTION_MAP = {
-    "prep": prep,
-    "train": train,
-    "eval": eval,
-    "predict": predict,
-    "learncurve": learning_curve,
+    "prep": ("vak.cli.prep", "prep"),
+    "train": ("vak.cli.train", "train"),
+    "eval": ("vak.cli.eval", "eval"),
+    "predict": ("vak.cli.predict", "predict"),
+    "learncurve": ("vak.cli.learncurve", "learning_curve"),
 }
 
 CLI_COMMANDS = tuple(COMMAND_FUNCTION_MAP.keys())
@@ -26,7 +25,9 @@ def cli(command, config_file):
     config_file : str, Path
         path to a config.toml file
     """
-    if command in COMMAND_FUNCTION_MAP:
-        COMMAND_FUNCTION_MAP[command](toml_path=config_file)
-    else:
+    if command not in COMMAND_FUNCTION_MAP:
         raise ValueError(f"command not recognized: {command}")
+
+    module_name, function_name = COMMAND_FUNCTION_MAP[command]
+    command_function = getattr(importlib.import_module(module_name), function_name)
+    command_function(toml_path=config_file)
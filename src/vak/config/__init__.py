@@ -1,14 +1,29 @@
 """sub-package that parses config.toml files and returns config object"""
-from . import (
-    config,
-    dataloader,
-    eval,
-    learncurve,
-    models,
-    parse,
-    predict,
-    prep,
-    spect_params,
-    train,
-    validators,
-)
+import importlib
+
+
+__all__ = [
+    "config",
+    "dataloader",
+    "eval",
+    "learncurve",
+    "models",
+    "parse",
+    "predict",
+    "prep",
+    "spect_params",
+    "train",
+    "validators",
+]
+
+
+def __getattr__(name):
+    # sub-modules are imported on first access, so that importing vak
+    # does not import everything needed to parse every section of a config file
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,3 +1,4 @@
+import functools
 from pathlib import Path
 from distutils.util import strtobool
 
@@ -20,6 +21,9 @@ def comma_separated_list(value):
         )
 
 
+# cached because the same paths are converted each time a config is parsed,
+# e.g. by each command run on a config file, and ``Path`` objects are immutable
+@functools.lru_cache(maxsize=128)
 def expanded_user_path(value):
     return Path(value).expanduser()
 
@@ -679,7 +679,7 @@ class WindowDataset(VisionDataset):
                 spect_dict = files.spect.load(spect_path)
                 n_tb_spect = spect_dict[spect_key].shape[-1]
 
-                spect_id_vector.append(np.ones((n_tb_spect,), dtype=np.int64) * ind)
+                spect_id_vector.append(np.full((n_tb_spect,), ind, dtype=np.int64))
                 spect_inds_vector.append(np.arange(n_tb_spect))
 
                 valid_x_inds = np.arange(total_tb, total_tb + n_tb_spect)
@@ -727,7 +727,7 @@ class WindowDataset(VisionDataset):
             for ind, spect_path in enumerate(spect_paths):
                 n_tb_spect = WindowDataset.n_time_bins_spect(spect_path, spect_key)
 
-                spect_id_vector.append(np.ones((n_tb_spect,), dtype=np.int64) * ind)
+                spect_id_vector.append(np.full((n_tb_spect,), ind, dtype=np.int64))
                 spect_inds_vector.append(np.arange(n_tb_spect))
 
                 valid_x_inds = np.arange(total_tb, total_tb + n_tb_spect)
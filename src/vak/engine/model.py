@@ -228,6 +228,13 @@ class Model:
 
         n_batches = 0
 
+        # check once, instead of for every batch, whether we need to
+        # convert labeled timebins to labels to compute string-based metrics
+        compute_labels = any(
+            "levenshtein" in metric_name or "segment_error_rate" in metric_name
+            for metric_name in self.metrics.keys()
+        )
+
         progress_bar = tqdm(eval_data)
         with torch.no_grad():
             for ind, batch in enumerate(progress_bar):
@@ -269,17 +276,7 @@ class Model:
                     out = out[:, :, padding_mask]
                     y_pred = y_pred[:, padding_mask]
 
-                if any(
-                    [
-                        "levenshtein" in metric_name
-                        for metric_name in self.metrics.keys()
-                    ]
-                ) or any(
-                    [
-                        "segment_error_rate" in metric_name
-                        for metric_name in self.metrics.keys()
-                    ]
-                ):
+                if compute_labels:
                     y_labels = lbl_tb2labels(
                         y.cpu().numpy(), eval_data.dataset.labelmap
                     )
@@ -1,4 +1,6 @@
 import fnmatch
+import functools
+import os
 from pathlib import Path
 import re
 
@@ -18,17 +20,59 @@ def find_fname(fname, ext):
     Returns
     -------
     sub_fname : str or None
+        ``fname`` up to and including ``.ext``,
+        or None if ``.ext`` is not found in ``fname``.
 
     Examples
     --------
     >>> sub_fname(fname='llb3_0003_2018_04_23_14_18_54.wav.mat', ext='wav')
     'llb3_0003_2018_04_23_14_18_54.wav'
     """
-    m = re.match(f"[\S]*{ext}", fname)
-    if hasattr(m, "group"):
-        return m.group()
-    elif m is None:
-        return m
+    # use string methods instead of a regex, since we are looking for a literal.
+    # Find the last occurrence so that e.g. 'bird.wav.mat' returns 'bird.wav'
+    ind = fname.rfind(f".{ext}")
+    if ind == -1:
+        return None
+    return fname[: ind + len(ext) + 1]
+
+
+@functools.lru_cache(maxsize=32)
+def _suffix_matcher(ext):
+    """returns a function that is True when a file name
+    ends with extension ``ext``, ignoring case.
+
+    Cached so the same matcher is re-used across calls to ``from_dir``.
+    For extensions that contain glob wildcards, the matcher uses a compiled
+    case-insensitive regex; otherwise it is a plain string comparison.
+    """
+    if any(char in ext for char in "*?["):
+        # use fnmatch + re to make search case-insensitive
+        # adopted from:
+        # https://gist.github.com/techtonik/5694830
+        # https://jdhao.github.io/2019/06/24/python_glob_case_sensitivity/
+        rule = re.compile(fnmatch.translate(f"*.{ext}"), re.IGNORECASE)
+        return lambda name: rule.match(name) is not None
+
+    suffix = f".{ext}".lower()
+    return lambda name: name.lower().endswith(suffix)
+
+
+def _scan_dir(dir_path, matcher):
+    """scan a directory once, returning paths to files whose names match,
+    and paths to sub-directories, as strings.
+
+    Uses ``os.scandir`` because ``DirEntry.is_file`` and ``DirEntry.is_dir``
+    can use the file type returned when reading the directory,
+    instead of calling ``stat`` on every path.
+    """
+    files, subdirs = [], []
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if matcher(entry.name) and entry.is_file():
+                files.append(entry.path)
+            elif entry.is_dir():
+                subdirs.append(entry.path)
+    return files, subdirs
 
 
 def from_dir(dir_path, ext):
@@ -63,32 +107,23 @@ def from_dir(dir_path, ext):
     used by vak.io.audio.files_from_dir and vak.io.annot.files_from_dir
     """
     dir_path = Path(dir_path)
-    if not dir_path.is_dir():
-        raise NotADirectoryError(f"dir_path not recognized as a directory: {dir_path}")
 
-    # use fnmatch + re to make search case-insensitive
-    # adopted from:
-    # https://gist.github.com/techtonik/5694830
-    # https://jdhao.github.io/2019/06/24/python_glob_case_sensitivity/
-    glob_pat = f"*.{ext}"
-    rule = re.compile(fnmatch.translate(glob_pat), re.IGNORECASE)
+    matcher = _suffix_matcher(ext)
 
-    files = [
-        file for file in dir_path.iterdir() if file.is_file() and rule.match(file.name)
-    ]
+    # no separate check that dir_path is a directory before scanning it;
+    # os.scandir fails if it is not, and we only need to stat dir_path once
+    try:
+        files, subdirs = _scan_dir(dir_path, matcher)
+    except (FileNotFoundError, NotADirectoryError) as e:
+        raise NotADirectoryError(
+            f"dir_path not recognized as a directory: {dir_path}"
+        ) from e
 
     if len(files) == 0:
         # if we don't any files with extension, look in sub-directories
-        files = []
-        subdirs = [subdir for subdir in dir_path.iterdir() if subdir.is_dir()]
         for subdir in subdirs:
-            files.extend(
-                [
-                    file
-                    for file in subdir.iterdir()
-                    if file.is_file() and rule.match(file.name)
-                ]
-            )
+            subdir_files, _ = _scan_dir(subdir, matcher)
+            files.extend(subdir_files)
 
     if len(files) == 0:
         raise FileNotFoundError(
@@ -97,4 +132,4 @@ def from_dir(dir_path, ext):
         )
 
     # TODO: use / return Path instead of strings
-    return [str(file) for file in files]
+    return sorted(files)
@@ -39,7 +39,7 @@ def has_unlabeled(labels_int, onsets_s, offsets_s, time_bins):
         raise TypeError("labels_int must be a list or numpy.ndarray of integers")
 
     dummy_unlabeled_label = np.max(labels_int) + 1
-    label_vec = np.ones((time_bins.shape[-1], 1), dtype="int8") * dummy_unlabeled_label
+    label_vec = np.full((time_bins.shape[-1], 1), dummy_unlabeled_label)
     onset_inds = [np.argmin(np.abs(time_bins - onset)) for onset in onsets_s]
     offset_inds = [np.argmin(np.abs(time_bins - offset)) for offset in offsets_s]
     for label, onset, offset in zip(labels_int, onset_inds, offset_inds):
@@ -86,7 +86,7 @@ def label_timebins(labels_int, onsets_s, offsets_s, time_bins, unlabeled_label=0
     ):
         raise TypeError("labels_int must be a list or numpy.ndarray of integers")
 
-    label_vec = np.ones((time_bins.shape[-1],), dtype="int8") * unlabeled_label
+    label_vec = np.full((time_bins.shape[-1],), unlabeled_label, dtype="int8")
     onset_inds = [np.argmin(np.abs(time_bins - onset)) for onset in onsets_s]
     offset_inds = [np.argmin(np.abs(time_bins - offset)) for offset in offsets_s]
     for label, onset, offset in zip(labels_int, onset_inds, offset_inds):
@@ -177,20 +177,26 @@ def lbl_tb2labels(labeled_timebins, labels_mapping, spect_ID_vector=None):
         segment in each spectrogram as identified by spect_ID_vector.
     """
     labeled_timebins = row_or_1d(labeled_timebins)
-    idx = np.diff(labeled_timebins, axis=0).astype(bool)
-    idx = np.insert(idx, 0, True)
+    # find first time bin of each run of the same label:
+    # the first time bin, and any time bin whose label differs from the one before it.
+    # Compare in place, instead of np.diff + np.insert which each allocate a new array
+    idx = np.empty(labeled_timebins.shape, dtype=bool)
+    idx[:1] = True
+    np.not_equal(labeled_timebins[1:], labeled_timebins[:-1], out=idx[1:])
 
-    labels = labeled_timebins[idx]
-
-    # remove 'unlabeled' label
     if "unlabeled" in labels_mapping:
-        labels = labels[labels != labels_mapping["unlabeled"]]
+        # remove 'unlabeled' label with the same indexing operation
+        labels = labeled_timebins[
+            idx & (labeled_timebins != labels_mapping["unlabeled"])
+        ]
+    else:
+        labels = labeled_timebins[idx]
 
     # replace any multiple character labels in mapping
     # with dummy single-character labels
     # so that we do not affect Levenshtein distance computation
     # see https://github.com/NickleDave/vak/issues/373
-    if any([len(label) > 1 for label in labels_mapping.keys()]):  # only re-map if necessary
+    if any(len(label) > 1 for label in labels_mapping.keys()):  # only re-map if necessary
         # (to minimize chance of knock-on bugs)
         labels_mapping = _multi_char_labels_to_single_char(labels_mapping)
 
@@ -211,15 +217,15 @@ def lbl_tb2labels(labeled_timebins, labels_mapping, spect_ID_vector=None):
         for spect_ID in spect_IDs:
             these = np.where(spect_ID_vector == spect_ID)
             curr_labels = labels_arr[these].tolist()
-            if all([type(el) is str for el in curr_labels]):
+            if all(type(el) is str for el in curr_labels):
                 labels_list.append("".join(curr_labels))
-            elif all([type(el) is int for el in curr_labels]):
+            elif all(type(el) is int for el in curr_labels):
                 labels_list.append(curr_labels)
         return labels_list, spect_ID_vector
     else:
-        if all([type(el) is str or type(el) is np.str_ for el in labels]):
+        if all(type(el) is str or type(el) is np.str_ for el in labels):
             return "".join(labels)
-        elif all([type(el) is int for el in labels]):
+        elif all(type(el) is int for el in labels):
             return labels
 
 
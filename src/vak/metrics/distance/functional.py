@@ -1,14 +1,19 @@
-import numpy as np
+import functools
 
 
-def levenshtein(source, target):
+def levenshtein(source, target, max_dist=None):
     """Levenshtein distance: number of deletions, insertions,
     or substitutions required to convert source string
     into target string.
 
     Parameters
     ----------
-    source, target : str
+    source, target : str, list
+        sequences to compare; elements are compared with ``!=``
+    max_dist : int
+        If specified, stop as soon as the distance is known to be
+        greater than ``max_dist``, and return ``max_dist + 1``.
+        Default is None, in which case the exact distance is always returned.
 
     Returns
     -------
@@ -16,56 +21,180 @@ def levenshtein(source, target):
         number of deletions, insertions, or substitutions
         required to convert source into target.
 
+    Notes
+    -----
+    Uses the bit-parallel algorithm of Myers (1999).
+    If elements of the sequences are not hashable,
+    falls back to a dynamic programming algorithm
     adapted from https://github.com/toastdriven/pylev/blob/master/pylev.py
     to fix issues with the Numpy implementation in
     https://en.wikibooks.org/wiki/Algorithm_Implementation/Strings/Levenshtein_distance#Python
     """
+    if type(source) is str and type(target) is str:
+        return _levenshtein_cached(source, target, max_dist)
+    return _levenshtein(source, target, max_dist)
+
+
+# cache results for str, since when evaluating a model we compute metrics
+# that all need the distance between the same pair of label sequences,
+# e.g. both Levenshtein and SegmentErrorRate
+@functools.lru_cache(maxsize=16)
+def _levenshtein_cached(source, target, max_dist):
+    return _levenshtein(source, target, max_dist)
+
+
+def _levenshtein(source, target, max_dist):
+    """helper function that computes Levenshtein distance,
+    called by ``levenshtein``"""
     if source == target:
         return 0
 
-    # We call tuple() to force strings to be used as sequences
-    # ('c', 'a', 't', 's') - numpy uses them as values by default.
-    source = np.array(tuple(source))
-    target = np.array(tuple(target))
+    len_source = len(source)
+    len_target = len(target)
 
-    len_source = source.size
-    len_target = target.size
+    if max_dist is None:
+        # distance is never greater than length of longer sequence
+        max_dist = max(len_source, len_target)
 
     if len_source == 0:
-        return len_target
+        return min(len_target, max_dist + 1)
     if len_target == 0:
-        return len_source
+        return min(len_source, max_dist + 1)
 
     if len_source > len_target:
         source, target = target, source
         len_source, len_target = len_target, len_source
 
-    # We use a dynamic programming algorithm, but with the
-    # added optimization that we only need the last two rows
-    # of the matrix.
-    d0 = np.arange(len_target + 1)
-    d1 = np.arange(len_target + 1)
-    for i in range(len_source):
-        d1[0] = i + 1
-        for j in range(len_target):
-            cost = d0[j]
-
-            if source[i] != target[j]:
+    # distance is at least the difference in length
+    if len_target - len_source > max_dist:
+        return max_dist + 1
+
+    try:
+        return _levenshtein_myers(source, target, max_dist)
+    except TypeError:
+        # elements are not hashable, so they can't be mapped to bit-vectors;
+        # fall back to dynamic programming, which only needs ``!=``
+        return _levenshtein_dp(source, target, max_dist)
+
+
+def _levenshtein_myers(source, target, max_dist):
+    """bit-parallel algorithm for Levenshtein distance, from [1]_,
+    as formulated in [2]_. Default algorithm used by ``levenshtein``.
+
+    Instead of computing one cell of the dynamic programming matrix at a time,
+    encodes the differences between vertically adjacent cells in a column
+    as bit-vectors, with one bit for each element of ``target``,
+    and updates the whole column with a few integer operations
+    for each element of ``source``.
+    Python integers have arbitrary precision, so ``target``
+    does not need to be split into blocks of 64 elements.
+
+    Iterates over ``source``, so this should be the shorter sequence.
+    Elements of ``target`` must be hashable.
+    Returns ``max_dist + 1`` early if the distance must be greater than ``max_dist``.
+
+    References
+    ----------
+    .. [1] Myers, G. (1999). A fast bit-vector algorithm for approximate
+       string matching based on dynamic programming. Journal of the ACM, 46(3), 395-415.
+    .. [2] Hyyrö, H. (2001). Explaining and extending the bit-parallel approximate
+       string matching algorithm of Myers. Technical report A-2001-10,
+       University of Tampere.
+    """
+    # for each unique element, a bit-vector where bit j is set
+    # if that element is at index j in target
+    match_bits = {}
+    bit = 1
+    for target_el in target:
+        match_bits[target_el] = match_bits.get(target_el, 0) | bit
+        bit <<= 1
+
+    len_source = len(source)
+    len_target = len(target)
+    mask = (1 << len_target) - 1
+    last_bit = 1 << (len_target - 1)
+
+    # vertical positive and negative deltas, between rows j - 1 and j of current column
+    pos_vert = mask
+    neg_vert = 0
+    distance = len_target
+    for i, source_el in enumerate(source, start=1):
+        eq = match_bits.get(source_el, 0)
+        x_vert = eq | neg_vert
+        x_horz = (((eq & pos_vert) + pos_vert) ^ pos_vert) | eq
+        # horizontal positive and negative deltas, between this column and the last
+        pos_horz = neg_vert | (~(x_horz | pos_vert) & mask)
+        neg_horz = pos_vert & x_horz
+
+        # update distance for the last row
+        if pos_horz & last_bit:
+            distance += 1
+        elif neg_horz & last_bit:
+            distance -= 1
+        # distance can decrease by at most one for each remaining element of source
+        if distance - (len_source - i) > max_dist:
+            return max_dist + 1
+
+        # shift in 1 because the first row increases by one in every column
+        pos_horz = ((pos_horz << 1) | 1) & mask
+        neg_horz = (neg_horz << 1) & mask
+        pos_vert = neg_horz | (~(x_vert | pos_horz) & mask)
+        neg_vert = pos_horz & x_vert
+
+    return min(distance, max_dist + 1)
+
+
+def _levenshtein_dp(source, target, max_dist):
+    """dynamic programming algorithm used by ``levenshtein``
+    when elements of the sequences are not hashable, with the added optimization that we only need one row
+    of the matrix, plus the previous value on the diagonal.
+
+    Operates on plain Python sequences and integers.
+    Indexing into numpy arrays one element at a time
+    is much slower than indexing into lists or strings,
+    and this loop runs ``len(source) * len(target)`` times.
+
+    Only cells within ``max_dist`` of the diagonal are computed,
+    because the value of a cell is at least its distance from the diagonal
+    (Ukkonen's cut-off). Cells outside that band are treated as ``max_dist + 1``.
+    Returns ``max_dist + 1`` early if every cell in a row is greater than ``max_dist``.
+    """
+    len_target = len(target)
+    out_of_band = max_dist + 1
+    # single row of the matrix, overwritten in place as we go.
+    # Before d[j] is overwritten with the value for row i, it holds the value
+    # for row i - 1 ("above"), which becomes the diagonal for column j + 1
+    d = [min(j, out_of_band) for j in range(len_target + 1)]
+    for i, source_el in enumerate(source, start=1):
+        j_start = max(1, i - max_dist)
+        j_stop = min(len_target, i + max_dist)
+        diagonal = d[j_start - 1]
+        d[j_start - 1] = i if j_start == 1 else out_of_band
+        for j in range(j_start, j_stop + 1):
+            above = d[j]
+            cost = diagonal
+
+            if source_el != target[j - 1]:
                 cost += 1  # substitution
 
-                x_cost = d1[j] + 1  # insertion
+                x_cost = d[j - 1] + 1  # insertion
                 if x_cost < cost:
                     cost = x_cost
 
-                y_cost = d0[j + 1] + 1
+                y_cost = above + 1
                 if y_cost < cost:
                     cost = y_cost
 
-            d1[j + 1] = cost
+            d[j] = cost
+            diagonal = above
 
-        d0, d1 = d1, d0
+        if j_stop < len_target:
+            # so the next row sees this cell as outside the band
+            d[j_stop + 1] = out_of_band
+        if min(d[j_start - 1 : j_stop + 1]) > max_dist:
+            return out_of_band
 
-    return d0[-1]
+    return min(d[-1], out_of_band)
 
 
 def segment_error_rate(y_pred, y_true):
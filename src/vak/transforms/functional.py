@@ -81,10 +81,10 @@ def pad_to_window(arr, window_size, padval=0.0, return_padding_mask=True):
     target_width = int(np.ceil(width / window_size) * window_size)
 
     if arr.ndim == 1:
-        padded = np.ones((target_width,)) * padval
+        padded = np.full((target_width,), padval, dtype=np.float64)
         padded[:width] = arr
     elif arr.ndim == 2:
-        padded = np.ones((height, target_width)) * padval
+        padded = np.full((height, target_width), padval, dtype=np.float64)
         padded[:, :width] = arr
 
     if return_padding_mask:
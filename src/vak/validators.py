@@ -21,6 +21,10 @@ def column_or_1d(y, warn=False):
     -------
     y : array
     """
+    if isinstance(y, np.ndarray) and y.ndim == 1:
+        # fast path for the common case, skips np.shape + np.ravel
+        return y
+
     shape = np.shape(y)
     if len(shape) == 1:
         return np.ravel(y)
@@ -50,6 +54,10 @@ def row_or_1d(y, warn=False):
     -------
     y : array
     """
+    if isinstance(y, np.ndarray) and y.ndim == 1:
+        # fast path for the common case, skips np.shape + np.ravel
+        return y
+
     shape = np.shape(y)
     if len(shape) == 1:
         return np.ravel(y)
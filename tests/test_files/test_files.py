@@ -4,11 +4,17 @@ import pytest
 import vak.files.files
 
 
-def test_find_fname():
-    fname = "llb3_0003_2018_04_23_14_18_54.wav.mat"
-    ext = "wav"
+@pytest.mark.parametrize(
+    ("fname", "ext", "expected"),
+    [
+        ("llb3_0003_2018_04_23_14_18_54.wav.mat", "wav", "llb3_0003_2018_04_23_14_18_54.wav"),
+        ("/home/user/bird song/gy6or6_032312.cbin.spect.npz", "cbin", "/home/user/bird song/gy6or6_032312.cbin"),
+        ("/home/user/wav_files/gy6or6_032312.cbin.spect.npz", "wav", None),
+    ],
+)
+def test_find_fname(fname, ext, expected):
     out = vak.files.files.find_fname(fname, ext)
-    assert out == "llb3_0003_2018_04_23_14_18_54.wav"
+    assert out == expected
 
 
 def test_files_from_dir_with_mat(spect_dir_mat, spect_list_mat):
@@ -49,3 +55,27 @@ def test_from_dir_searches_child_dir(dir_path, ext):
     files = vak.files.files.from_dir(dir_path, ext)
     assert len(files) > 0
     assert all([str(file).endswith(ext) for file in files])
+
+
+@pytest.mark.parametrize(
+    ("ext", "expected_names"),
+    [
+        ("wav", ["a.WAV", "b.wav"]),
+        ("w?v", ["a.WAV", "b.wav"]),
+        ("*", ["a.WAV", "b.wav", "c.txt"]),
+    ],
+)
+def test_from_dir_ext_with_wildcards(tmp_path, ext, expected_names):
+    for name in ("a.WAV", "b.wav", "c.txt"):
+        (tmp_path / name).touch()
+    files = vak.files.files.from_dir(tmp_path, ext)
+    assert files == [str(tmp_path / name) for name in expected_names]
+
+
+def test_from_dir_not_a_directory_raises(tmp_path):
+    a_file = tmp_path / "a.wav"
+    a_file.touch()
+    with pytest.raises(NotADirectoryError):
+        vak.files.files.from_dir(a_file, "wav")
+    with pytest.raises(NotADirectoryError):
+        vak.files.files.from_dir(tmp_path / "does-not-exist", "wav")
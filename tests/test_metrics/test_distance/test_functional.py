@@ -29,6 +29,54 @@ def test_levenshtein(source, target, expected_distance):
     assert distance == expected_distance
 
 
+@pytest.mark.parametrize(
+    "source, target, expected_distance",
+    [
+        # longer than 64 elements, the width of a machine word
+        ("a" * 200, "b" * 200, 200),
+        ("ab" * 100, "ba" * 100, 2),
+        ("kitten" * 30, "sitting" * 30, 90),
+        ("confide" * 20, "deceit" * 40, 161),
+        ("deceit" * 40, "confide" * 20, 161),
+    ]
+)
+def test_levenshtein_long_sequences(source, target, expected_distance):
+    distance = vak.metrics.distance.functional.levenshtein(source, target)
+    assert distance == expected_distance
+
+
+@pytest.mark.parametrize(
+    "source, target, max_dist, expected_distance",
+    [
+        ("kitten", "sitting", 3, 3),
+        ("kitten", "sitting", 2, 3),
+        ("kitten", "sitting", 0, 1),
+        ("kitten", "kitten", 0, 0),
+        ("kitten", "", 2, 3),
+        ("", "sitting", 10, 7),
+        ("levenshtein", "frankenstein", 5, 6),
+        ("levenshtein", "frankenstein", 6, 6),
+        ("a" * 200, "b" * 200, 10, 11),
+        ("ab" * 100, "ba" * 100, 2, 2),
+        ("kitten" * 30, "sitting" * 30, 200, 90),
+    ]
+)
+def test_levenshtein_max_dist(source, target, max_dist, expected_distance):
+    distance = vak.metrics.distance.functional.levenshtein(source, target, max_dist=max_dist)
+    assert distance == expected_distance
+
+
+@pytest.mark.parametrize(
+    "source, target, expected_distance",
+    LEV_PARAMETRIZE
+)
+def test_levenshtein_unhashable_elements(source, target, expected_distance):
+    source = [[el] for el in source]
+    target = [[el] for el in target]
+    distance = vak.metrics.distance.functional.levenshtein(source, target)
+    assert distance == expected_distance
+
+
 @pytest.mark.parametrize(
     "y_pred, y_true, expected_distance",
     LEV_PARAMETRIZE